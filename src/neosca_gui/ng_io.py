@@ -1,18 +1,34 @@
 #!/usr/bin/env python3
 
 try:
-    from xml.etree.ElementTree import XML, fromstring
+    from lxml import etree
+
+    HAS_LXML = True
+except ImportError:
+    from xml.etree import ElementTree as etree
+
+    HAS_LXML = False
+# Optional, cchardet (from the faust-cchardet package) detects encodings much
+# faster than charset_normalizer
+try:
+    import cchardet
+
+    HAS_CCHARDET = True
 except ImportError:
-    from xml.etree.ElementTree import XML, fromstring
+    HAS_CCHARDET = False
+import codecs
 import glob
+import io
 import logging
+import os
 import os.path as os_path
 import sys
+import threading
 import zipfile
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from os import PathLike
-from typing import Any, ByteString, Callable, Dict, Iterable, Optional, Set, Union
-
-from charset_normalizer import detect
+from typing import IO, Any, ByteString, Callable, Dict, Generator, Iterable, Optional, Set, Tuple, Union
 
 from neosca_gui.ng_platform_info import IS_WINDOWS
 from neosca_gui.ng_util import SCAProcedureResult
@@ -20,19 +36,74 @@ from neosca_gui.ng_util import SCAProcedureResult
 
 class SCAIO:
     SUPPORTED_EXTENSIONS = ("txt", "docx", "odt")
+    # For membership tests
+    SUPPORTED_EXTENSION_SET = frozenset(SUPPORTED_EXTENSIONS)
+    SUPPORTED_EXTENSION_BYTES_SET = frozenset(extension.encode() for extension in SUPPORTED_EXTENSIONS)
 
     DOCX_NAMESPACE = "{http://schemas.openxmlformats.org/wordprocessingml/2006/main}"
-    DOCX_PARA = DOCX_NAMESPACE + "p"
-    DOCX_TEXT = DOCX_NAMESPACE + "t"
-
-    ODT_NAMESPACE = ".//{urn:oasis:names:tc:opendocument:xmlns:text:1.0}"
-    ODT_PARA = ODT_NAMESPACE + "p"
+    # Interned as they are compared against the tag of every parsed element
+    DOCX_PARA = sys.intern(DOCX_NAMESPACE + "p")
+    DOCX_TEXT = sys.intern(DOCX_NAMESPACE + "t")
+
+    ODT_NAMESPACE = "{urn:oasis:names:tc:opendocument:xmlns:text:1.0}"
+    ODT_PARA = sys.intern(ODT_NAMESPACE + "p")
+
+    DOCX_NSMAP = {"w": "http://schemas.openxmlformats.org/wordprocessingml/2006/main"}
+    if HAS_LXML:
+        # Compiled once, lxml collects the text nodes in C instead of walking
+        # the tree in Python
+        DOCX_TEXT_XPATH = etree.XPath(".//w:t/text()", namespaces=DOCX_NSMAP)
+        ODT_TEXT_XPATH = etree.XPath(".//text()")
+
+    # UTF-32 BOMs go first as the UTF-16 ones are their prefixes
+    BOM_ENCODINGS = (
+        (codecs.BOM_UTF32_LE, "utf-32"),
+        (codecs.BOM_UTF32_BE, "utf-32"),
+        (codecs.BOM_UTF8, "utf-8-sig"),
+        (codecs.BOM_UTF16_LE, "utf-16"),
+        (codecs.BOM_UTF16_BE, "utf-16"),
+    )
+    ENCODING_DETECTION_SAMPLE_SIZES = (1 << 15, 1 << 18)
+    FILE_CACHE_MAXSIZE = 64
 
     def __init__(self):
         self.extension_readfunc_map: Dict[str, Callable] = {
             extension: getattr(self, f"read_{extension}") for extension in self.SUPPORTED_EXTENSIONS
         }
         self.previous_encoding: str = "utf-8"
+        # LRU cache of file contents keyed by (path, mtime_ns, size)
+        self.file_cache: OrderedDict[Tuple[str, int, int], str] = OrderedDict()
+        self.file_cache_lock = threading.Lock()
+
+    def iterparse_paragraphs(self, source: IO[bytes], tag: str) -> Generator[Any, None, None]:
+        """
+        Incrementally parse the xml source and yield elements of the given tag
+        in the same order as tree.iter(tag) on the fully parsed tree. Each
+        outermost paragraph is cleared once consumed so that memory usage
+        does not grow with document size.
+        """
+        if HAS_LXML:
+            context = etree.iterparse(source, events=("start", "end"), tag=tag)
+        else:
+            context = etree.iterparse(source, events=("start", "end"))
+
+        depth = 0
+        for event, elem in context:
+            if elem.tag != tag:
+                continue
+            if event == "start":
+                depth += 1
+                continue
+            depth -= 1
+            # Paragraphs can be nested, e.g., in docx text boxes or odt notes,
+            # wait for the outermost one to complete
+            if depth > 0:
+                continue
+            yield from elem.iter(tag)
+            elem.clear()
+            if HAS_LXML:
+                while elem.getprevious() is not None:
+                    del elem.getparent()[0]
 
     def read_docx(self, path: str) -> str:
         """
@@ -41,27 +112,30 @@ class SCAIO:
 
         https://etienned.github.io/posts/extract-text-from-word-docx-simply/
         """
-        with zipfile.ZipFile(path) as zip_file:
-            xml_content = zip_file.read("word/document.xml")
-        tree = XML(xml_content)
-
-        paragraphs = []
-        for paragraph in tree.iter(self.DOCX_PARA):
-            text = "".join(node.text for node in paragraph.iter(self.DOCX_TEXT) if node.text)
-            paragraphs.append(text)
-        return "\n".join(paragraphs)
+        with zipfile.ZipFile(path) as zip_file, zip_file.open("word/document.xml") as member:
+            paragraphs = self.iterparse_paragraphs(member, self.DOCX_PARA)
+            if HAS_LXML:
+                return "\n".join("".join(self.DOCX_TEXT_XPATH(paragraph)) for paragraph in paragraphs)
+            return "\n".join(
+                "".join([node.text for node in paragraph.iter(self.DOCX_TEXT) if node.text])
+                for paragraph in paragraphs
+            )
 
     def read_odt(self, path: str) -> str:
-        with zipfile.ZipFile(path) as zip_file:
-            xml_content = zip_file.read("content.xml")
-        root = fromstring(xml_content)
-        paragraphs = root.findall(self.ODT_PARA)
-        return "\n".join("".join(node.itertext()) for node in paragraphs)
-
-    def _read_txt(self, path: str, mode: str, encoding: Optional[str] = None) -> Union[str, ByteString]:
+        with zipfile.ZipFile(path) as zip_file, zip_file.open("content.xml") as member:
+            paragraphs = self.iterparse_paragraphs(member, self.ODT_PARA)
+            if HAS_LXML:
+                return "\n".join("".join(self.ODT_TEXT_XPATH(paragraph)) for paragraph in paragraphs)
+            return "\n".join("".join(paragraph.itertext()) for paragraph in paragraphs)
+
+    def _read_txt(
+        self, path: str, mode: str, encoding: Optional[str] = None, size: int = -1, buffering: int = 1 << 20
+    ) -> Union[str, ByteString]:
         try:
-            with open(path, mode=mode, encoding=encoding) as f:
-                content = f.read()
+            # Text mode decodes and translates newlines incrementally, which
+            # avoids holding the whole byte string alongside the decoded one
+            with open(path, mode=mode, encoding=encoding, buffering=buffering) as f:
+                content = f.read(size)
         # input file existence has already been checked in main.py, here check
         # it again in case users remove input files during runtime
         except FileNotFoundError:
@@ -70,41 +144,133 @@ class SCAIO:
         else:
             return content
 
+    @staticmethod
+    def _decode(bytes_: bytes, encoding: str) -> str:
+        # Translate newlines as reading in text mode would do
+        return io.TextIOWrapper(io.BytesIO(bytes_), encoding=encoding).read()
+
     def read_txt(self, path: str, is_guess_encoding: bool = True) -> Optional[str]:
         if not is_guess_encoding:
             return self._read_txt(path, "r", "utf-8")  # type:ignore
 
-        try:
-            logging.info(f"Attempting to read {path} with {self.previous_encoding} encoding...")
-            content = self._read_txt(path, "r", self.previous_encoding)  # type:ignore
-        except UnicodeDecodeError:
-            logging.info(f"Attempt failed. Reading {path} in binary mode...")
-            bytes_ = self._read_txt(path, "rb")
-            logging.info("Guessing the encoding of the byte string...")
-            encoding = detect(bytes_)["encoding"]  # type:ignore
+        # Unbuffered, or the 4-byte read would fill a whole 1 MiB buffer
+        head: bytes = self._read_txt(path, "rb", size=4, buffering=0)  # type:ignore
+        for bom, encoding in self.BOM_ENCODINGS:
+            if head.startswith(bom):
+                logging.info(f"Found {encoding} BOM, reading {path} with {encoding} encoding...")
+                return self._read_txt(path, "r", encoding)  # type:ignore
+
+        # Most inputs are UTF-8, try it and the last successful encoding
+        # before falling back to the much slower charset detection
+        for encoding in dict.fromkeys(("utf-8", self.previous_encoding)):
+            try:
+                logging.info(f"Attempting to read {path} with {encoding} encoding...")
+                return self._read_txt(path, "r", encoding)  # type:ignore
+            except UnicodeDecodeError:
+                logging.info("Attempt failed.")
+
+        logging.info(f"Reading {path} in binary mode...")
+        bytes_: bytes = self._read_txt(path, "rb")  # type:ignore
+        logging.info("Guessing the encoding of the byte string...")
+        guessed = self._guess_and_decode(bytes_)
+        if guessed is None:
+            logging.warning(f"{path} is of unsupported file type. Skipped.")
+            return None
 
-            if encoding is None:
-                logging.warning(f"{path} is of unsupported file type. Skipped.")
-                return None
+        encoding, content = guessed
+        self.previous_encoding = encoding
+        logging.info(f"Decoded the byte string with {encoding} encoding.")
+        return content
+
+    @staticmethod
+    def detect_encoding(bytes_: bytes) -> Optional[str]:
+        if HAS_CCHARDET:
+            return cchardet.detect(bytes_)["encoding"]
+
+        # charset_normalizer is slow to import, load it only when needed
+        from charset_normalizer import from_bytes
 
-            self.previous_encoding = encoding  # type:ignore
-            logging.info(f"Decoding the byte string with {encoding} encoding...")
-            content = bytes_.decode(encoding=encoding)  # type:ignore
+        best_guess = from_bytes(bytes_).best()
+        return best_guess.encoding if best_guess is not None else None
 
-        return content  # type:ignore
+    def _guess_and_decode(self, bytes_: bytes) -> Optional[Tuple[str, str]]:
+        """
+        Guess the encoding on increasingly larger heads of the byte string,
+        as detection quality saturates after a few KB and there is no need to
+        scan the whole file. Return the encoding and the decoded string.
+        """
+        size = len(bytes_)
+        samples = (
+            # Cut at a line break to avoid splitting a multi-byte character
+            bytes_[: bytes_.rfind(b"\n", 0, sample_size) + 1 or sample_size]
+            for sample_size in self.ENCODING_DETECTION_SAMPLE_SIZES
+            if sample_size < size
+        )
+        for sample in (*samples, bytes_):
+            encoding = self.detect_encoding(sample)
+            if encoding is None:
+                continue
+            try:
+                return encoding, self._decode(bytes_, encoding)
+            except (UnicodeDecodeError, LookupError):
+                continue
+        return None
 
     @classmethod
     def suffix(cls, path: str) -> str:
-        *_, extension = path.split(".")
-        return extension
+        return path.rpartition(".")[2]
 
     def read_file(self, path: str) -> Optional[str]:
         extension = self.suffix(path)
-        if extension not in self.SUPPORTED_EXTENSIONS:
+        if extension not in self.SUPPORTED_EXTENSION_SET:
             logging.warning(f"[SCAIO] {path} is of unsupported filetype. Skipping.")
             return None
 
-        return self.extension_readfunc_map[extension](path)
+        try:
+            stat = os.stat(path)
+        except FileNotFoundError:
+            # Let the reader report the missing file
+            return self.extension_readfunc_map[extension](path)
+
+        # The same file may be read over and over in a session, e.g., when
+        # regenerating tables, skip decoding/parsing if it is unchanged
+        key = (path, stat.st_mtime_ns, stat.st_size)
+        with self.file_cache_lock:
+            if (content := self.file_cache.get(key)) is not None:
+                self.file_cache.move_to_end(key)
+                return content
+
+        content = self.extension_readfunc_map[extension](path)
+        if content is not None:
+            with self.file_cache_lock:
+                self.file_cache[key] = content
+                if len(self.file_cache) > self.FILE_CACHE_MAXSIZE:
+                    self.file_cache.popitem(last=False)
+        return content
+
+    def read_files(self, paths: Iterable[str], max_workers: Optional[int] = None) -> Dict[str, Optional[str]]:
+        """
+        Read files concurrently. Reading is mostly I/O, zip inflation, and XML
+        parsing, all of which release the GIL, so threads overlap well.
+
+        The SCA/LCA workers do not use this, they read each file with
+        read_file only after finding no parse cache for it.
+        """
+        paths = list(dict.fromkeys(paths))
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            return dict(zip(paths, executor.map(self.read_file, paths), strict=True))
+
+    @classmethod
+    def get_file_sizes(cls, paths: Iterable[str], max_workers: Optional[int] = None) -> Dict[str, int]:
+        """
+        Stat files concurrently, so that folders on network shares or slow
+        disks do not cost one round trip per file in turn.
+        """
+        paths = list(dict.fromkeys(paths))
+        if len(paths) < 2:
+            return {path: os_path.getsize(path) for path in paths}
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            return dict(zip(paths, executor.map(os_path.getsize, paths), strict=True))
 
     @classmethod
     def is_writable(cls, filename: str) -> SCAProcedureResult:
@@ -133,22 +299,24 @@ class SCAIO:
         import pickle
 
         if os_path.isfile(file_path) and os_path.getsize(file_path) > 0:
-            with open(file_path, "rb") as f:
-                data_pickle_lzma = f.read()
-
-            data_pickle = lzma.decompress(data_pickle_lzma)
-            return pickle.loads(data_pickle)
+            # Decompress and unpickle in lockstep instead of holding both the
+            # compressed and the decompressed bytes in memory
+            with lzma.open(file_path, "rb") as f:
+                return pickle.load(f)
         else:
             return default
 
     @classmethod
     def load_pickle_file(cls, file_path: Union[str, PathLike], default: Any = None) -> Any:
+        """
+        Pickle files are expected to be dumped with pickle.HIGHEST_PROTOCOL,
+        which the C unpickler loads fastest.
+        """
         import pickle
 
         if os_path.isfile(file_path) and os_path.getsize(file_path) > 0:
-            with open(file_path, "rb") as f:
-                data_pickle = f.read()
-            return pickle.loads(data_pickle)
+            with open(file_path, "rb", buffering=1 << 20) as f:
+                return pickle.load(f)
         else:
             return default
 
@@ -157,50 +325,67 @@ class SCAIO:
         import lzma
 
         if os_path.isfile(file_path) and os_path.getsize(file_path) > 0:
-            with open(file_path, "rb") as f:
-                data_lzma = f.read()
-
-            data = lzma.decompress(data_lzma)
-            return data
+            with lzma.open(file_path, "rb") as f:
+                return f.read()
         else:
             return default
 
     def get_verified_ifile_list(self, ifile_list: Iterable[str]) -> Set[str]:
-        verified_ifile_list = []
+        # On Windows, skip "~$*.docx" lock files that Word creates alongside opened documents
+        def is_lock_file(file_name: str) -> bool:
+            return IS_WINDOWS and file_name.startswith("~") and file_name.endswith(".docx")
+
+        verified_ifile_list: Set[str] = set()
         for path in ifile_list:
             if os_path.isfile(path):
                 extension = self.suffix(path)
-                if extension not in self.SUPPORTED_EXTENSIONS:
+                if extension not in self.SUPPORTED_EXTENSION_SET:
                     logging.warning(f"[SCAIO] {path} is of unsupported filetype. Skipping.")
                     continue
+                if is_lock_file(os_path.basename(path)):
+                    continue
                 logging.debug(f"[SCAIO] Adding {path} to input file list")
-                verified_ifile_list.append(path)
+                verified_ifile_list.add(path)
             elif os_path.isdir(path):
-                verified_ifile_list.extend(
-                    path
-                    for path in glob.glob(f"{path}{os_path.sep}*")
-                    if os_path.isfile(path) and self.suffix(path) in self.SUPPORTED_EXTENSIONS
+                # scandir gets names and file types of all entries at once,
+                # instead of one stat call per entry. Hidden files are skipped
+                # as glob("*") does.
+                if IS_WINDOWS:
+                    with os.scandir(path) as entries:
+                        verified_ifile_list.update(
+                            entry.path
+                            for entry in entries
+                            if not entry.name.startswith(".")
+                            and not is_lock_file(entry.name)
+                            and entry.is_file()
+                            and self.suffix(entry.name) in self.SUPPORTED_EXTENSION_SET
+                        )
+                else:
+                    # Scan with bytes on POSIX so that only the names of
+                    # matched entries are decoded
+                    with os.scandir(os.fsencode(path)) as entries:
+                        verified_ifile_list.update(
+                            os.fsdecode(entry.path)
+                            for entry in entries
+                            if not entry.name.startswith(b".")
+                            and entry.is_file()
+                            and entry.name.rpartition(b".")[2] in self.SUPPORTED_EXTENSION_BYTES_SET
+                        )
+            elif matched_paths := glob.glob(path):
+                verified_ifile_list.update(
+                    path for path in matched_paths if not is_lock_file(os_path.basename(path))
                 )
-            elif glob.glob(path):
-                verified_ifile_list.extend(glob.glob(path))
             else:
                 logging.critical(f"No such file as\n\n{path}")
                 sys.exit(1)
-        if IS_WINDOWS:
-            verified_ifile_list = [
-                path
-                for path in verified_ifile_list
-                if not (path.endswith(".docx") and os_path.basename(path).startswith("~"))
-            ]
-        return set(verified_ifile_list)
+        return verified_ifile_list
 
     @classmethod
     def has_valid_cache(cls, file_path: str, cache_path: str) -> bool:
-        ret = False
-        is_exist = os_path.exists(cache_path)
-        if is_exist:
-            is_not_empty = os_path.getsize(cache_path) > 0
-            is_cache_newer_than_input = os_path.getmtime(cache_path) > os_path.getmtime(file_path)
-            if is_not_empty and is_cache_newer_than_input:
-                ret = True
-        return ret
+        # One stat call per path; integer nanosecond mtimes avoid float rounding
+        try:
+            cache_stat = os.stat(cache_path)
+            file_stat = os.stat(file_path)
+        except FileNotFoundError:
+            return False
+        return cache_stat.st_size > 0 and cache_stat.st_mtime_ns > file_stat.st_mtime_ns
@@ -1,15 +1,14 @@
 #!/usr/bin/env python3
 
-import glob
 import os
 import os.path as os_path
 import re
 import subprocess
 import sys
-from typing import Generator, List, Set
+from typing import Dict, Generator, List, Optional, Set, Tuple
 
 from PySide6.QtCore import QModelIndex, Qt
-from PySide6.QtGui import QAction, QCursor, QStandardItem
+from PySide6.QtGui import QAction, QCursor, QKeySequence, QStandardItem
 from PySide6.QtWidgets import (
     QAbstractItemView,
     QApplication,
@@ -34,11 +33,11 @@ from neosca_gui.ng_sca.structure_counter import StructureCounter
 from neosca_gui.ng_about import __title__, __version__
 from neosca_gui.ng_io import SCAIO
 from neosca_gui.ng_lca.lca import LCA
-from neosca_gui.ng_platform_info import IS_MAC
+from neosca_gui.ng_platform_info import IS_MAC, IS_WINDOWS
 from neosca_gui.ng_qss import Ng_QSS
 from neosca_gui.ng_settings.ng_dialog_settings import Ng_Dialog_Settings
 from neosca_gui.ng_settings.ng_settings import Ng_Settings
-from neosca_gui.ng_settings.ng_settings_default import available_import_types
+from neosca_gui.ng_settings.ng_settings_default import DEFAULT_INTERFACE_SCALING, available_import_types
 from neosca_gui.ng_threads import Ng_Thread, Ng_Worker_LCA_Generate_Table, Ng_Worker_SCA_Generate_Table
 from neosca_gui.ng_widgets.ng_dialogs import (
     Ng_Dialog_Processing_With_Elapsed_Time,
@@ -48,6 +47,16 @@ from neosca_gui.ng_widgets.ng_dialogs import (
 from neosca_gui.ng_widgets.ng_tables import Ng_Delegate_SCA, Ng_StandardItemModel, Ng_TableView
 from neosca_gui.ng_widgets.ng_widgets import Ng_ScrollArea
 
+# Column headers of the result tables, built once at import
+SCA_HEADER_LABELS: Tuple[str, ...] = tuple(StructureCounter.DEFAULT_MEASURES)
+LCA_HEADER_LABELS: Tuple[str, ...] = LCA.FIELDNAMES[1:]
+# Bound only to the generate button of the current tab
+SHORTCUT_GENERATE_TABLE = QKeySequence("CTRL+G")
+# "125%" -> "1.25"; the result for the default scaling is folded here since
+# most launches use it
+QT_SCALE_FACTOR_PATTERN = re.compile(r"([0-9]{2})%$")
+DEFAULT_QT_SCALE_FACTOR: str = QT_SCALE_FACTOR_PATTERN.sub(r".\1", DEFAULT_INTERFACE_SCALING)
+
 
 class Ng_Main(QMainWindow):
     def __init__(self, *args, **kwargs):
@@ -60,11 +69,20 @@ class Ng_Main(QMainWindow):
          font-size: {Ng_Settings.value('Appearance/font-size')}pt;
          }}"""
         self.setStyleSheet(qss)
+        self.update_dpi()
+        QApplication.instance().primaryScreenChanged.connect(self.update_dpi)
         self.setup_menu()
         self.setup_worker()
         self.setup_main_window()
         self.fix_macos_layout(self)
 
+    def update_dpi(self) -> None:
+        # Used to convert table sizes from pixels on exporting, refreshed
+        # only when the primary screen changes
+        screen = QApplication.primaryScreen()
+        self.dpi_horizontal: float = screen.logicalDotsPerInchX()
+        self.dpi_vertical: float = screen.logicalDotsPerInchY()
+
     # https://github.com/BLKSerene/Wordless/blob/fa743bcc2a366ec7a625edc4ed6cfc355b7cd22e/wordless/wl_main.py#L266
     def fix_macos_layout(self, parent):
         if not IS_MAC:
@@ -153,7 +171,7 @@ class Ng_Main(QMainWindow):
 
     def setup_tab_sca(self):
         self.button_generate_table_sca = QPushButton("Generate table")
-        self.button_generate_table_sca.setShortcut("CTRL+G")
+        self.button_generate_table_sca.setShortcut(SHORTCUT_GENERATE_TABLE)
         self.button_export_table_sca = QPushButton("Export table...")
         self.button_export_table_sca.setEnabled(False)
         # self.button_export_selected_cells = QPushButton("Export selected cells...")
@@ -169,8 +187,8 @@ class Ng_Main(QMainWindow):
         self.button_custom_func.clicked.connect(self.custom_func)
 
         self.model_sca = Ng_StandardItemModel(main=self)
-        self.model_sca.setColumnCount(len(StructureCounter.DEFAULT_MEASURES))
-        self.model_sca.setHorizontalHeaderLabels(StructureCounter.DEFAULT_MEASURES)
+        self.model_sca.setColumnCount(len(SCA_HEADER_LABELS))
+        self.model_sca.setHorizontalHeaderLabels(SCA_HEADER_LABELS)
         self.model_sca.clear_data()
         self.tableview_sca = Ng_TableView(main=self, model=self.model_sca)
         self.tableview_sca.setItemDelegate(Ng_Delegate_SCA(None, self.styleSheet()))
@@ -182,16 +200,8 @@ class Ng_Main(QMainWindow):
         )
         self.button_export_matches_sca.clicked.connect(self.tableview_sca.export_matches)
         self.button_clear_table_sca.clicked.connect(lambda: self.model_sca.clear_data(confirm=True))
-        self.model_sca.data_cleared.connect(
-            lambda: self.button_generate_table_sca.setEnabled(True) if not self.model_file.is_empty() else None
-        )
-        self.model_sca.data_cleared.connect(lambda: self.button_export_table_sca.setEnabled(False))
-        self.model_sca.data_cleared.connect(lambda: self.button_export_matches_sca.setEnabled(False))
-        self.model_sca.data_cleared.connect(lambda: self.button_clear_table_sca.setEnabled(False))
-        self.model_sca.data_updated.connect(lambda: self.button_export_table_sca.setEnabled(True))
-        self.model_sca.data_updated.connect(lambda: self.button_export_matches_sca.setEnabled(True))
-        self.model_sca.data_updated.connect(lambda: self.button_clear_table_sca.setEnabled(True))
-        self.model_sca.data_updated.connect(lambda: self.button_generate_table_sca.setEnabled(False))
+        self.model_sca.data_cleared.connect(self.on_model_sca_data_cleared)
+        self.model_sca.data_updated.connect(self.on_model_sca_data_updated)
 
         # Setting area
         self.checkbox_cache_sca = QCheckBox("Cache")
@@ -223,7 +233,6 @@ class Ng_Main(QMainWindow):
         ):
             self.layout_previewarea_sca.addWidget(btn, 1, btn_no - 1)
         self.layout_previewarea_sca.addWidget(self.tableview_sca, 0, 0, 1, btn_no)
-        self.layout_previewarea_sca.addWidget(self.scrollarea_settings_sca, 0, btn_no, 2, 1)
         self.layout_previewarea_sca.setContentsMargins(0, 0, 0, 0)
 
         self.splitter_workarea_sca = QSplitter(Qt.Orientation.Horizontal)
@@ -237,9 +246,21 @@ class Ng_Main(QMainWindow):
     def custom_func(self):
         breakpoint()
 
+    def on_model_sca_data_cleared(self) -> None:
+        if not self.model_file.is_empty():
+            self.button_generate_table_sca.setEnabled(True)
+        self.button_export_table_sca.setEnabled(False)
+        self.button_export_matches_sca.setEnabled(False)
+        self.button_clear_table_sca.setEnabled(False)
+
+    def on_model_sca_data_updated(self) -> None:
+        self.button_export_table_sca.setEnabled(True)
+        self.button_export_matches_sca.setEnabled(True)
+        self.button_clear_table_sca.setEnabled(True)
+        self.button_generate_table_sca.setEnabled(False)
+
     def setup_tab_lca(self):
         self.button_generate_table_lca = QPushButton("Generate table")
-        self.button_generate_table_lca.setShortcut("CTRL+G")
         self.button_export_table_lca = QPushButton("Export table...")
         self.button_export_table_lca.setEnabled(False)
         # self.button_export_selected_cells = QPushButton("Export selected cells...")
@@ -248,8 +269,8 @@ class Ng_Main(QMainWindow):
         self.button_clear_table_lca.setEnabled(False)
 
         self.model_lca = Ng_StandardItemModel(main=self)
-        self.model_lca.setColumnCount(len(LCA.FIELDNAMES) - 1)
-        self.model_lca.setHorizontalHeaderLabels(LCA.FIELDNAMES[1:])
+        self.model_lca.setColumnCount(len(LCA_HEADER_LABELS))
+        self.model_lca.setHorizontalHeaderLabels(LCA_HEADER_LABELS)
         self.model_lca.clear_data()
         self.tableview_lca = Ng_TableView(main=self, model=self.model_lca)
         # TODO: tableview_sca use custom delegate to only enable
@@ -264,14 +285,8 @@ class Ng_Main(QMainWindow):
             lambda: self.tableview_lca.export_table("neosca_lca_results.xlsx")
         )
         self.button_clear_table_lca.clicked.connect(lambda: self.model_lca.clear_data(confirm=True))
-        self.model_lca.data_cleared.connect(
-            lambda: self.button_generate_table_lca.setEnabled(True) if not self.model_file.is_empty() else None
-        )
-        self.model_lca.data_cleared.connect(lambda: self.button_export_table_lca.setEnabled(False))
-        self.model_lca.data_cleared.connect(lambda: self.button_clear_table_lca.setEnabled(False))
-        self.model_lca.data_updated.connect(lambda: self.button_export_table_lca.setEnabled(True))
-        self.model_lca.data_updated.connect(lambda: self.button_clear_table_lca.setEnabled(True))
-        self.model_lca.data_updated.connect(lambda: self.button_generate_table_lca.setEnabled(False))
+        self.model_lca.data_cleared.connect(self.on_model_lca_data_cleared)
+        self.model_lca.data_updated.connect(self.on_model_lca_data_updated)
 
         # Setting area
         self.radiobutton_wordlist_BNC = QRadioButton("British National Corpus (BNC) wordlist")
@@ -329,15 +344,33 @@ class Ng_Main(QMainWindow):
         self.splitter_workarea_lca.setStretchFactor(1, 1)
         self.splitter_workarea_lca.setContentsMargins(6, 4, 6, 4)
 
+    def on_model_lca_data_cleared(self) -> None:
+        if not self.model_file.is_empty():
+            self.button_generate_table_lca.setEnabled(True)
+        self.button_export_table_lca.setEnabled(False)
+        self.button_clear_table_lca.setEnabled(False)
+
+    def on_model_lca_data_updated(self) -> None:
+        self.button_export_table_lca.setEnabled(True)
+        self.button_clear_table_lca.setEnabled(True)
+        self.button_generate_table_lca.setEnabled(False)
+
     def enable_button_generate_table(self, enabled: bool) -> None:
         self.button_generate_table_sca.setEnabled(enabled)
-        self.button_generate_table_lca.setEnabled(enabled)
+        if self.is_tab_lca_set_up:
+            self.button_generate_table_lca.setEnabled(enabled)
+
+    def on_model_file_data_cleared(self) -> None:
+        self.enable_button_generate_table(False)
+
+    def on_model_file_data_updated(self) -> None:
+        self.enable_button_generate_table(True)
 
     def setup_tableview_file(self) -> None:
         self.model_file = Ng_StandardItemModel(main=self)
         self.model_file.setHorizontalHeaderLabels(("Name", "Path"))
-        self.model_file.data_cleared.connect(lambda: self.enable_button_generate_table(False))
-        self.model_file.data_updated.connect(lambda: self.enable_button_generate_table(True))
+        self.model_file.data_cleared.connect(self.on_model_file_data_cleared)
+        self.model_file.data_updated.connect(self.on_model_file_data_updated)
         self.model_file.clear_data()
         self.tableview_file = Ng_TableView(main=self, model=self.model_file, has_vertical_header=False)
         self.tableview_file.setEditTriggers(QAbstractItemView.EditTrigger.NoEditTriggers)
@@ -352,13 +385,20 @@ class Ng_Main(QMainWindow):
         self.tableview_file.customContextMenuRequested.connect(self.show_menu_for_tableview_file)
 
     def setup_main_window(self):
+        # The LCA tab is not shown at startup, so its widgets are built on
+        # the first activation of its placeholder
+        self.is_tab_lca_set_up: bool = False
         self.setup_tab_sca()
-        self.setup_tab_lca()
         self.setup_tableview_file()
 
+        self.widget_tab_lca = QWidget()
+        self.layout_tab_lca = QGridLayout(self.widget_tab_lca)
+        self.layout_tab_lca.setContentsMargins(0, 0, 0, 0)
+
         self.tabwidget = QTabWidget()
         self.tabwidget.addTab(self.splitter_workarea_sca, "Syntactic Complexity Analyzer")
-        self.tabwidget.addTab(self.splitter_workarea_lca, "Lexical Complexity Analyzer")
+        self.tabwidget.addTab(self.widget_tab_lca, "Lexical Complexity Analyzer")
+        self.tabwidget.currentChanged.connect(self.on_tabwidget_current_changed)
         self.splitter_central_widget = QSplitter(Qt.Orientation.Vertical)
         self.splitter_central_widget.setChildrenCollapsible(False)
         self.splitter_central_widget.addWidget(self.tabwidget)
@@ -367,12 +407,31 @@ class Ng_Main(QMainWindow):
         self.splitter_central_widget.setStretchFactor(1, 1)
         self.setCentralWidget(self.splitter_central_widget)
 
-    def sca_add_data(self, counter: StructureCounter, file_name: str, rowno: int) -> None:
-        # Remove trailing rows
-        self.model_sca.removeRows(rowno, self.model_sca.rowCount() - rowno)
-        for colno in range(self.model_sca.columnCount()):
-            sname = self.model_sca.horizontalHeaderItem(colno).text()
+    def on_tabwidget_current_changed(self, index: int) -> None:
+        if self.tabwidget.widget(index) is self.widget_tab_lca:
+            self.ensure_tab_lca_set_up()
+            self.button_generate_table_sca.setShortcut(QKeySequence())
+            self.button_generate_table_lca.setShortcut(SHORTCUT_GENERATE_TABLE)
+        else:
+            self.button_generate_table_sca.setShortcut(SHORTCUT_GENERATE_TABLE)
+            if self.is_tab_lca_set_up:
+                self.button_generate_table_lca.setShortcut(QKeySequence())
+
+    def ensure_tab_lca_set_up(self) -> None:
+        if self.is_tab_lca_set_up:
+            return
+        self.setup_tab_lca()
+        self.layout_tab_lca.addWidget(self.splitter_workarea_lca)
+        self.button_generate_table_lca.setEnabled(not self.model_file.is_empty())
+        self.fix_macos_layout(self.widget_tab_lca)
+        self.is_tab_lca_set_up = True
 
+    def sca_add_data(self, counter: StructureCounter, file_name: str, rowno: int) -> None:
+        # Drop rows left by a previous run when its first result comes in,
+        # row 0 itself is overwritten below
+        if rowno == 0:
+            self.model_sca.removeRows(1, self.model_sca.rowCount() - 1)
+        for colno, sname in enumerate(SCA_HEADER_LABELS):
             value = counter.get_value(sname)
             value_str: str = str(value) if value is not None else ""
             item = QStandardItem(value_str)
@@ -381,8 +440,8 @@ class Ng_Main(QMainWindow):
             if matches := counter.get_matches(sname):
                 item.setData(matches, Qt.ItemDataRole.UserRole)
 
+        # data_updated is emitted once by the worker after the last file
         self.model_sca.setVerticalHeaderItem(rowno, QStandardItem(file_name))
-        self.model_sca.data_updated.emit()
 
     def setup_worker(self) -> None:
         self.dialog_processing = Ng_Dialog_Processing_With_Elapsed_Time(self)
@@ -390,11 +449,19 @@ class Ng_Main(QMainWindow):
         self.ng_worker_sca_generate_table = Ng_Worker_SCA_Generate_Table(main=self)
         self.ng_worker_sca_generate_table.counter_ready.connect(self.sca_add_data)
         self.ng_thread_sca_generate_table = Ng_Thread(self.ng_worker_sca_generate_table)
+        # Stop repainting the table until all rows are added. This only holds
+        # back painting; the columns are fitted once on the data_updated that
+        # the worker emits after its last row. Connected before
+        # dialog_processing.exec as it blocks
+        self.ng_thread_sca_generate_table.started.connect(lambda: self.tableview_sca.setUpdatesEnabled(False))
+        self.ng_thread_sca_generate_table.finished.connect(lambda: self.tableview_sca.setUpdatesEnabled(True))
         self.ng_thread_sca_generate_table.started.connect(self.dialog_processing.exec)
         self.ng_thread_sca_generate_table.finished.connect(self.dialog_processing.accept)
 
         self.ng_worker_lca_generate_table = Ng_Worker_LCA_Generate_Table(main=self)
         self.ng_thread_lca_generate_table = Ng_Thread(self.ng_worker_lca_generate_table)
+        self.ng_thread_lca_generate_table.started.connect(lambda: self.tableview_lca.setUpdatesEnabled(False))
+        self.ng_thread_lca_generate_table.finished.connect(lambda: self.tableview_lca.setUpdatesEnabled(True))
         self.ng_thread_lca_generate_table.started.connect(self.dialog_processing.exec)
         self.ng_thread_lca_generate_table.finished.connect(self.dialog_processing.accept)
 
@@ -408,11 +475,19 @@ class Ng_Main(QMainWindow):
     def remove_file_paths(self) -> None:
         # https://stackoverflow.com/questions/5927499/how-to-get-selected-rows-in-qtableview
         indexes: List[QModelIndex] = self.tableview_file.selectionModel().selectedRows()
-        # Remove rows from bottom to top, or otherwise lower row indexes will
-        # change as upper rows are removed
-        rownos = sorted((index.row() for index in indexes), reverse=True)
-        for rowno in rownos:
-            self.model_file.takeRow(rowno)
+        # Remove runs of adjacent rows with one call each, from bottom to top,
+        # or otherwise lower row indexes will change as upper rows are removed
+        rownos = sorted(index.row() for index in indexes)
+        run_first = run_last = -1
+        for rowno in reversed(rownos):
+            if rowno == run_first - 1:
+                run_first = rowno
+                continue
+            if run_first != -1:
+                self.model_file.removeRows(run_first, run_last - run_first + 1)
+            run_first = run_last = rowno
+        if run_first != -1:
+            self.model_file.removeRows(run_first, run_last - run_first + 1)
         if self.model_file.rowCount() == 0:
             self.model_file.clear_data()
 
@@ -424,62 +499,88 @@ class Ng_Main(QMainWindow):
             for rowno in rownos:
                 model.takeRow(rowno)
 
-    # Type hint for generator: https://docs.python.org/3.12/library/typing.html#typing.Generator
-    def yield_model_column(self, model: Ng_StandardItemModel, colno: int) -> Generator[str, None, None]:
-        items = (model.item(rowno, colno) for rowno in range(model.rowCount()))
-        return (item.text() for item in items if item is not None)
-
-    def yield_added_file_names(self) -> Generator[str, None, None]:
-        colno_path = 0
-        return self.yield_model_column(self.model_file, colno_path)
-
-    def yield_added_file_paths(self) -> Generator[str, None, None]:
+    def yield_added_file_names_and_paths(self) -> Generator[Tuple[str, str], None, None]:
+        colno_name = 0
         colno_path = 1
-        return self.yield_model_column(self.model_file, colno_path)
-
-    def add_file_paths(self, file_paths_to_add: List[str]) -> None:
+        model = self.model_file
+        for rowno in range(model.rowCount()):
+            item_name = model.item(rowno, colno_name)
+            item_path = model.item(rowno, colno_path)
+            if item_name is not None and item_path is not None:
+                yield item_name.text(), item_path.text()
+
+    def add_file_paths(self, file_paths_to_add: List[str], file_sizes: Optional[Dict[str, int]] = None) -> None:
+        # file_sizes: sizes already known to the caller, other files are stat-ed here
+        if file_sizes is None:
+            file_sizes = {}
         unique_file_paths_to_add: Set[str] = set(file_paths_to_add)
-        already_added_file_paths: Set[str] = set(self.yield_added_file_paths())
-        file_paths_dup: Set[str] = unique_file_paths_to_add & already_added_file_paths
-        file_paths_unsupported: Set[str] = set(
-            filter(lambda p: SCAIO.suffix(p) not in SCAIO.SUPPORTED_EXTENSIONS, file_paths_to_add)
-        )
-        file_paths_empty: Set[str] = set(filter(lambda p: not os_path.getsize(p), unique_file_paths_to_add))
-        file_paths_ok: Set[str] = (
-            unique_file_paths_to_add
-            - already_added_file_paths
-            - file_paths_dup
-            - file_paths_unsupported
-            - file_paths_empty
-        )
+        already_added_file_paths: Set[str] = set(self.model_file.column_texts(1))
+        file_paths_dup: Set[str] = set()
+        file_paths_unsupported: Set[str] = set()
+        file_paths_empty: Set[str] = set()
+        file_paths_ok: Set[str] = set()
+        file_paths_supported: List[str] = []
+        # Classify each file by the first check it fails, so that duplicate
+        # and unsupported files are not stat-ed
+        extension_set = SCAIO.SUPPORTED_EXTENSION_SET
+        for file_path in unique_file_paths_to_add:
+            if file_path in already_added_file_paths:
+                file_paths_dup.add(file_path)
+            elif SCAIO.suffix(file_path) not in extension_set:
+                file_paths_unsupported.add(file_path)
+            else:
+                file_paths_supported.append(file_path)
+        # Stat-ing is I/O bound and slow on network shares, so run it concurrently
+        file_sizes = {
+            **file_sizes,
+            **SCAIO.get_file_sizes(path for path in file_paths_supported if path not in file_sizes),
+        }
+        for file_path in file_paths_supported:
+            if file_sizes[file_path]:
+                file_paths_ok.add(file_path)
+            else:
+                file_paths_empty.add(file_path)
         if file_paths_ok:
             self.model_file.remove_single_empty_row()
             colno_name = 0
-            already_added_file_names = list(
-                self.yield_model_column(self.model_file, colno_name)
-            )  # Here the already_added_file_names will have no duplicates
+            # Here the already_added_file_names will have no duplicates
+            already_added_file_names: Set[str] = set(self.model_file.column_texts(colno_name))
+            # Occurrence to start from for each file name, as the lower ones
+            # are known to be taken
+            next_occurrences: Dict[str, int] = {}
+            rows: List[Tuple[str, str]] = []
             for file_path in file_paths_ok:
                 file_name = os_path.splitext(os_path.basename(file_path))[0]
                 if file_name in already_added_file_names:
-                    occurrence = 2
+                    occurrence = next_occurrences.get(file_name, 2)
                     while f"{file_name} ({occurrence})" in already_added_file_names:
                         occurrence += 1
+                    next_occurrences[file_name] = occurrence + 1
                     file_name = f"{file_name} ({occurrence})"
-                already_added_file_names.append(file_name)
-                rowno = self.model_file.rowCount()
-                self.model_file.set_row_str(rowno, (file_name, file_path))
-                self.model_file.data_updated.emit()
+                already_added_file_names.add(file_name)
+                rows.append((file_name, file_path))
+            # Insert all the new rows at once rather than growing the model
+            # row by row, and notify listeners once afterwards
+            self.tableview_file.setUpdatesEnabled(False)
+            self.model_file.set_rows_str(self.model_file.rowCount(), rows)
+            self.tableview_file.setUpdatesEnabled(True)
+            self.model_file.data_updated.emit()
 
         if file_paths_dup or file_paths_unsupported or file_paths_empty:
             model_err_files = Ng_StandardItemModel(main=self)
             model_err_files.setHorizontalHeaderLabels(("Error Type", "File Path"))
-            for reason, file_paths in (
-                ("Duplicate file", file_paths_dup),
-                ("Unsupported file type", file_paths_unsupported),
-                ("Empty file", file_paths_empty),
-            ):
-                for file_path in file_paths:
-                    model_err_files.appendRow((QStandardItem(reason), QStandardItem(file_path)))
+            model_err_files.set_rows_str(
+                0,
+                [
+                    (reason, file_path)
+                    for reason, file_paths in (
+                        ("Duplicate file", file_paths_dup),
+                        ("Unsupported file type", file_paths_unsupported),
+                        ("Empty file", file_paths_empty),
+                    )
+                    for file_path in file_paths
+                ],
+            )
             tableview_err_files = Ng_TableView(main=self, model=model_err_files, has_vertical_header=False)
 
             dialog = Ng_Dialog_Table(
@@ -502,10 +603,30 @@ class Ng_Main(QMainWindow):
         if not folder_path:
             return
 
-        file_paths_to_add = []
-        for extension in SCAIO.SUPPORTED_EXTENSIONS:
-            file_paths_to_add.extend(glob.glob(os_path.join(folder_path, f"*.{extension}")))
-        self.add_file_paths(file_paths_to_add)
+        # One pass over the folder instead of a glob per extension. Sizes
+        # come along so add_file_paths does not stat the files again
+        file_paths_to_add: List[str] = []
+        file_sizes: Dict[str, int] = {}
+        with os.scandir(folder_path) as entries:
+            for entry in entries:
+                # Hidden files are skipped, as glob("*.txt") would do
+                if entry.name.startswith("."):
+                    continue
+                extension = SCAIO.suffix(entry.name)
+                # glob matches case-insensitively on Windows, so files like
+                # NOTES.TXT are still passed on and reported by add_file_paths
+                if IS_WINDOWS:
+                    extension = extension.lower()
+                if extension not in SCAIO.SUPPORTED_EXTENSION_SET:
+                    continue
+                try:
+                    if not entry.is_file():
+                        continue
+                    file_sizes[entry.path] = entry.stat().st_size
+                except OSError:
+                    continue
+                file_paths_to_add.append(entry.path)
+        self.add_file_paths(file_paths_to_add, file_sizes)
 
     def menubar_file_open_file(self):
         file_paths_to_add, _ = QFileDialog.getOpenFileNames(
@@ -523,13 +644,25 @@ class Ng_Main(QMainWindow):
     def menubar_file_restart(self):
         self.close()
         command = [sys.executable, "-m", "neosca_gui"]
-        subprocess.call(command, env=os.environ.copy(), close_fds=False)
+        if IS_WINDOWS:
+            # os.exec* on Windows spawns a new process under a new PID instead
+            # of replacing this one, so start the new instance and quit
+            subprocess.Popen(command, close_fds=False)
+            QApplication.quit()
+        else:
+            # Replace the current process in place rather than keeping it
+            # resident until the new instance exits
+            Ng_Settings.sync()
+            os.execv(sys.executable, command)
 
 
 def main():
     ui_scaling = Ng_Settings.value("Appearance/interface-scaling")
     # https://github.com/BLKSerene/Wordless/blob/main/wordless/wl_main.py#L1238
-    os.environ["QT_SCALE_FACTOR"] = re.sub(r"([0-9]{2})%$", r".\1", ui_scaling)
+    if ui_scaling == DEFAULT_INTERFACE_SCALING:
+        os.environ["QT_SCALE_FACTOR"] = DEFAULT_QT_SCALE_FACTOR
+    else:
+        os.environ["QT_SCALE_FACTOR"] = QT_SCALE_FACTOR_PATTERN.sub(r".\1", ui_scaling)
     ng_app = QApplication(sys.argv)
     ng_window = Ng_Main()
     ng_window.showMaximized()
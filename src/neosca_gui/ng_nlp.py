@@ -120,7 +120,7 @@ class Ng_NLP_Stanza:
         attr = "processors"
         if hasattr(doc, attr):
             doc_dict["meta_data"][attr] = getattr(doc, attr)
-        return pickle.dumps(doc_dict)
+        return pickle.dumps(doc_dict, protocol=pickle.HIGHEST_PROTOCOL)
 
     @classmethod
     def serialized2doc(cls, data: bytes) -> Document:
@@ -2,6 +2,7 @@
 
 import os.path as os_path
 import re
+from functools import lru_cache
 from os import PathLike
 from typing import Any, Dict, Optional, Union
 
@@ -23,17 +24,33 @@ class Ng_QSS:
             return default
 
     @staticmethod
+    @lru_cache(maxsize=32)
+    def _get_selector_pattern(selector: str) -> "re.Pattern[str]":
+        # The whole selector followed by "{", so that "QHeaderView::section"
+        # does not match "QHeaderView::section:horizontal {"
+        return re.compile(rf"(?<![\w:#.-]){re.escape(selector)}\s*{{")
+
+    @staticmethod
+    @lru_cache(maxsize=32)
+    def _get_value_pattern(attrname: str) -> "re.Pattern[str]":
+        # The whole property name within the declaration block, so that
+        # "color" does not match "background-color"
+        return re.compile(rf"[^}}]*(?<![\w-]){re.escape(attrname)}:\s*([^;]+);")
+
+    @staticmethod
+    @lru_cache(maxsize=256)
     def get_value(qss: str, selector: str, attrname: str) -> Optional[str]:
         """
         >>> qss = "QHeaderView::section:horizontal { background-color: #5C88C5; }"
         >>> get_value(qss, "QHeaderView::section:horizontal", "background-color")
         #5C88C5
         """
-        # Note that only value of the 1st matched selector returned
-        matched_selector = re.search(selector, qss)
+        # Note that only value of the 1st matched selector returned. Results
+        # are cached as the same style sheet is queried repeatedly on export
+        matched_selector = Ng_QSS._get_selector_pattern(selector).search(qss)
         if matched_selector is None:
             return None
-        matched_value = re.search(rf"[^}}]+{attrname}:\s*([^;]+);", qss[matched_selector.end() :])
+        matched_value = Ng_QSS._get_value_pattern(attrname).match(qss, matched_selector.end())
         if matched_value is None:
             return None
         return matched_value.group(1)
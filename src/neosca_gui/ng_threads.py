@@ -1,8 +1,8 @@
 #!/usr/bin/env python3
 
-from typing import Generator, List, Optional
+from typing import Generator, List, Optional, Tuple
 
-from PySide6.QtCore import QObject, QThread, Signal
+from PySide6.QtCore import QObject, Qt, QThread, Signal
 from PySide6.QtGui import QStandardItem
 from PySide6.QtWidgets import QMessageBox
 
@@ -14,6 +14,8 @@ from neosca_gui.ng_widgets.ng_tables import Ng_StandardItemModel
 
 class Ng_Worker(QObject):
     worker_done = Signal()
+    # Long lists of skipped files are cut off to keep the message box usable
+    MAX_SKIPPED_FILES_SHOWN = 50
 
     def __init__(self, *args, main, **kwargs) -> None:
         super().__init__(*args, **kwargs)
@@ -22,6 +24,14 @@ class Ng_Worker(QObject):
     def run(self) -> None:
         raise NotImplementedError()
 
+    def show_skipped_files(self, err_file_paths: List[str]) -> None:
+        msg = "These files are skipped:\n- {}".format(
+            "\n- ".join(err_file_paths[: self.MAX_SKIPPED_FILES_SHOWN])
+        )
+        if (num_hidden := len(err_file_paths) - self.MAX_SKIPPED_FILES_SHOWN) > 0:
+            msg += f"\n... (+{num_hidden} more)"
+        QMessageBox.information(None, "Error Processing Files", msg)
+
 
 class Ng_Worker_SCA_Generate_Table(Ng_Worker):
     counter_ready = Signal(StructureCounter, str, int)
@@ -30,8 +40,9 @@ class Ng_Worker_SCA_Generate_Table(Ng_Worker):
         super().__init__(*args, main=main, **kwargs)
 
     def run(self) -> None:
-        input_file_names: Generator[str, None, None] = self.main.yield_added_file_names()
-        input_file_paths: Generator[str, None, None] = self.main.yield_added_file_paths()
+        input_file_names_and_paths: Generator[Tuple[str, str], None, None] = (
+            self.main.yield_added_file_names_and_paths()
+        )
 
         sca_kwargs = {
             "is_auto_save": False,
@@ -53,26 +64,27 @@ class Ng_Worker_SCA_Generate_Table(Ng_Worker):
             sca_instance.update_options(sca_kwargs)
 
         err_file_paths: List[str] = []
-        for rowno, (file_name, file_path) in enumerate(zip(input_file_names, input_file_paths)):
+        # Skipped files take no row, so the next counter goes to rowno
+        rowno = 0
+        for file_name, file_path in input_file_names_and_paths:
             try:
                 counter: Optional[StructureCounter] = sca_instance.parse_and_query_ifile(file_path)
                 # TODO should concern --no-parse, --no-query, ... after adding all available options
             except:
                 err_file_paths.append(file_path)
-                rowno -= 1
                 continue
             if counter is None:
                 err_file_paths.append(file_path)
-                rowno -= 1
                 continue
             self.counter_ready.emit(counter, file_name, rowno)
+            rowno += 1
+        # Notify views once for the whole batch, not per row, so that columns
+        # are fitted to contents only once
+        if rowno > 0:
+            self.main.model_sca.data_updated.emit()
 
         if err_file_paths:  # TODO: should show a table
-            QMessageBox.information(
-                None,
-                "Error Processing Files",
-                "These files are skipped:\n- {}".format("\n- ".join(err_file_paths)),
-            )
+            self.show_skipped_files(err_file_paths)
         self.worker_done.emit()
 
 
@@ -81,8 +93,7 @@ class Ng_Worker_LCA_Generate_Table(Ng_Worker):
         super().__init__(*args, main=main, **kwargs)
 
     def run(self) -> None:
-        input_file_names: Generator[str, None, None] = self.main.yield_added_file_names()
-        input_file_paths: Generator[str, None, None] = self.main.yield_added_file_paths()
+        input_file_names_and_paths: List[Tuple[str, str]] = list(self.main.yield_added_file_names_and_paths())
 
         lca_kwargs = {
             "wordlist": "bnc" if self.main.radiobutton_wordlist_BNC.isChecked() else "anc",
@@ -101,32 +112,39 @@ class Ng_Worker_LCA_Generate_Table(Ng_Worker):
 
         err_file_paths: List[str] = []
         model: Ng_StandardItemModel = self.main.model_lca
-        has_trailing_rows: bool = True
-        for rowno, (file_name, file_path) in enumerate(zip(input_file_names, input_file_paths)):
+        # Size the model once instead of growing it a row per file, rows
+        # of skipped files are dropped after the loop. Rows of a previous
+        # run are kept until then in case every file is skipped
+        rowcount_old = model.rowCount()
+        model.setRowCount(max(rowcount_old, len(input_file_names_and_paths)))
+        # Announce the filled rows to views once after the loop instead of
+        # once per item
+        model.blockSignals(True)
+        rowno = 0
+        for file_name, file_path in input_file_names_and_paths:
             try:
                 values = lca_instance._analyze(file_path=file_path)
             except:
                 err_file_paths.append(file_path)
-                rowno -= 1
                 continue
             if values is None:  # TODO: should pop up warning window
                 err_file_paths.append(file_path)
-                rowno -= 1
                 continue
-            if has_trailing_rows:
-                has_trailing_rows = model.removeRows(rowno, model.rowCount() - rowno)
             # Drop file_path
             del values[0]
             model.set_row_num(rowno, values)
             model.setVerticalHeaderItem(rowno, QStandardItem(file_name))
+            rowno += 1
+        model.blockSignals(False)
+        # Leave the previous table as it was if every file is skipped
+        model.setRowCount(rowno if rowno > 0 else rowcount_old)
+        if rowno > 0:
+            model.dataChanged.emit(model.index(0, 0), model.index(rowno - 1, model.columnCount() - 1))
+            model.headerDataChanged.emit(Qt.Orientation.Vertical, 0, rowno - 1)
             model.data_updated.emit()
 
         if err_file_paths:  # TODO: should show a table
-            QMessageBox.information(
-                None,
-                "Error Processing Files",
-                "These files are skipped:\n- {}".format("\n- ".join(err_file_paths)),
-            )
+            self.show_skipped_files(err_file_paths)
 
         self.worker_done.emit()
 
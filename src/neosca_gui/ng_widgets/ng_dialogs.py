@@ -3,7 +3,7 @@
 import json
 import re
 from enum import Enum
-from typing import TYPE_CHECKING, List, Union
+from typing import TYPE_CHECKING, Dict, List, Optional, Union
 
 from PySide6.QtCore import (
     QElapsedTimer,
@@ -244,10 +244,15 @@ class Ng_Dialog_TextEdit_SCA_Matched_Subtrees(Ng_Dialog_TextEdit):
 
 
 class Ng_Dialog_TextEdit_Citing(Ng_Dialog_TextEdit):
+    # Loaded from CITING_PATH on first use and shared by later dialogs
+    style_citation_mapping: Optional[Dict[str, str]] = None
+
     def __init__(self, *args, **kwargs):
         super().__init__(*args, title="Citing", **kwargs)
-        with open(CITING_PATH, encoding="utf-8") as f:
-            self.style_citation_mapping = json.load(f)
+        if Ng_Dialog_TextEdit_Citing.style_citation_mapping is None:
+            with open(CITING_PATH, encoding="utf-8") as f:
+                Ng_Dialog_TextEdit_Citing.style_citation_mapping = json.load(f)
+        self.style_citation_mapping: Dict[str, str] = Ng_Dialog_TextEdit_Citing.style_citation_mapping
 
         self.label_citing = QLabel(f"If you use {__title__} in your research, please kindly cite as follows.")
         self.label_citing.setWordWrap(True)
@@ -1,8 +1,13 @@
 #!/usr/bin/env python3
 
+import csv
 import os.path as os_path
-from typing import Dict, Iterable, List, Literal, Optional, Tuple, Union
+from typing import Any, Dict, Iterable, List, Literal, Optional, Sequence, Tuple, Union
 
+import openpyxl
+from openpyxl.cell import WriteOnlyCell
+from openpyxl.styles import Alignment, Font, PatternFill
+from openpyxl.utils import get_column_letter
 from PySide6.QtCore import (
     QModelIndex,
     QPoint,
@@ -18,7 +23,6 @@ from PySide6.QtGui import (
 )
 from PySide6.QtWidgets import (
     QAbstractItemView,
-    QApplication,
     QFileDialog,
     QHeaderView,
     QMessageBox,
@@ -39,6 +43,8 @@ class Ng_StandardItemModel(QStandardItemModel):
     # data_updated: itemChanged && !data_cleared
     data_updated = Signal()
     data_exported = Signal()
+    # Whether an item holds a number, set by set_item_num/set_item_str
+    IsNumericRole = Qt.ItemDataRole.UserRole + 1
 
     def __init__(self, *args, main, orientation: Literal["hor", "ver"] = "hor", **kwargs) -> None:
         super().__init__(*args, **kwargs)
@@ -46,26 +52,60 @@ class Ng_StandardItemModel(QStandardItemModel):
         self.orientation = orientation
 
         self.has_been_exported: bool = False
+        self.messagebox_clear: Optional[QMessageBox] = None
+        self.leave_an_empty_row_on_clear: bool = True
         self.data_exported.connect(lambda: self.set_has_been_exported(True))
         self.data_updated.connect(lambda: self.set_has_been_exported(False))
 
+        # New items are cloned from these to get alignment and IsNumericRole
+        # without setting them item by item
+        self.item_prototype_str = QStandardItem()
+        self.item_prototype_str.setTextAlignment(Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignVCenter)
+        self.item_prototype_str.setData(False, self.IsNumericRole)
+        self.item_prototype_num = QStandardItem()
+        self.item_prototype_num.setTextAlignment(Qt.AlignmentFlag.AlignRight | Qt.AlignmentFlag.AlignVCenter)
+        self.item_prototype_num.setData(True, self.IsNumericRole)
+
     def set_item_str(self, rowno: int, colno: int, value: Union[QStandardItem, str]) -> None:
-        item = value if isinstance(value, QStandardItem) else QStandardItem(value)
-        item.setTextAlignment(Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignVCenter)
+        if isinstance(value, QStandardItem):
+            item = value
+            item.setTextAlignment(Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignVCenter)
+            item.setData(False, self.IsNumericRole)
+        else:
+            item = self.item_prototype_str.clone()
+            item.setText(value)
         self.setItem(rowno, colno, item)
 
     def set_row_str(self, rowno: int, values: Iterable[Union[QStandardItem, str]]) -> None:
         for colno, value in enumerate(values):
             self.set_item_str(rowno, colno, value)
 
+    def set_rows_str(self, rowno_start: int, rows: Sequence[Iterable[Union[QStandardItem, str]]]) -> None:
+        """
+        Insert rows at rowno_start and fill them silently, then notify views
+        with one dataChanged over the inserted range
+        """
+        if not rows:
+            return
+        self.insertRows(rowno_start, len(rows))
+        self.blockSignals(True)
+        for rowno, values in enumerate(rows, start=rowno_start):
+            self.set_row_str(rowno, values)
+        self.blockSignals(False)
+        self.dataChanged.emit(
+            self.index(rowno_start, 0), self.index(rowno_start + len(rows) - 1, self.columnCount() - 1)
+        )
+
     def set_item_num(self, rowno: int, colno: int, value: Union[QStandardItem, int, float, str]) -> None:
         if isinstance(value, QStandardItem):
             item = value
+            item.setTextAlignment(Qt.AlignmentFlag.AlignRight | Qt.AlignmentFlag.AlignVCenter)
+            item.setData(True, self.IsNumericRole)
         else:
             if not isinstance(value, str):
                 value = str(value)
-            item = QStandardItem(value)
-        item.setTextAlignment(Qt.AlignmentFlag.AlignRight | Qt.AlignmentFlag.AlignVCenter)
+            item = self.item_prototype_num.clone()
+            item.setText(value)
         self.setItem(rowno, colno, item)
 
     def set_row_num(self, rowno: int, values: Iterable[Union[QStandardItem, int, float, str]]) -> None:
@@ -76,6 +116,10 @@ class Ng_StandardItemModel(QStandardItemModel):
         self.has_been_exported = exported
 
     def _clear_data(self, leave_an_empty_row=True) -> None:
+        # Views are refreshed by a single model reset rather than by the
+        # signals of each setRowCount/setColumnCount call
+        self.beginResetModel()
+        self.blockSignals(True)
         if self.orientation == "hor":
             self.setRowCount(0)
             if leave_an_empty_row:
@@ -84,6 +128,8 @@ class Ng_StandardItemModel(QStandardItemModel):
             self.setColumnCount(0)
             if leave_an_empty_row:
                 self.setColumnCount(1)
+        self.blockSignals(False)
+        self.endResetModel()
         self.data_cleared.emit()
 
     def clear_data(self, confirm=False, leave_an_empty_row=True) -> None:
@@ -93,18 +139,39 @@ class Ng_StandardItemModel(QStandardItemModel):
         if not confirm or self.has_been_exported:
             return self._clear_data(leave_an_empty_row=leave_an_empty_row)
 
-        messagebox = QMessageBox(self.main)
-        messagebox.setWindowTitle("Clear Table")
-        messagebox.setText("The table has not been exported yet and all the data will be lost. Continue?")
-        messagebox.setStandardButtons(QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No)
+        # The confirmation box is built on first use and reused afterwards
+        if self.messagebox_clear is None:
+            self.messagebox_clear = QMessageBox(self.main)
+            self.messagebox_clear.setWindowTitle("Clear Table")
+            self.messagebox_clear.setText(
+                "The table has not been exported yet and all the data will be lost. Continue?"
+            )
+            self.messagebox_clear.setStandardButtons(
+                QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No
+            )
+            self.messagebox_clear.accepted.connect(
+                lambda: self._clear_data(leave_an_empty_row=self.leave_an_empty_row_on_clear)
+            )
+        self.leave_an_empty_row_on_clear = leave_an_empty_row
+        self.messagebox_clear.exec()
 
-        messagebox.accepted.connect(lambda: self._clear_data(leave_an_empty_row=leave_an_empty_row))
-        messagebox.exec()
+    def column_texts(self, colno: int) -> List[str]:
+        """
+        Texts of the non-empty items in a column, from top to bottom
+        """
+        item = self.item
+        texts = []
+        for rowno in range(self.rowCount()):
+            if (cell := item(rowno, colno)) is not None:
+                texts.append(cell.text())
+        return texts
 
     def is_empty(self):
+        item_at = self.item
+        columns = range(self.columnCount())
         for row in range(self.rowCount()):
-            for column in range(self.columnCount()):
-                item = self.item(row, column)
+            for column in columns:
+                item = item_at(row, column)
                 if item is not None and item.text() != "":
                     return False
         return True
@@ -168,6 +235,25 @@ class Ng_Delegate_SCA(QStyledItemDelegate):
 
 
 class Ng_TableView(QTableView):
+    OPENPYXL_HORIZONTAL_HEADER_ALIGNMENT = Alignment(horizontal="center", vertical="center", wrap_text=True)
+    OPENPYXL_VERTICAL_HEADER_ALIGNMENT = Alignment(horizontal="left", vertical="center", wrap_text=True)
+    # Qt.AlignmentFlag bits, in order of precedence, and their openpyxl names
+    OPENPYXL_HORIZONTAL_ALIGNMENTS: Tuple[Tuple[int, str], ...] = (
+        (Qt.AlignmentFlag.AlignLeft.value, "left"),
+        (Qt.AlignmentFlag.AlignRight.value, "right"),
+        (Qt.AlignmentFlag.AlignHCenter.value, "center"),
+        (Qt.AlignmentFlag.AlignJustify.value, "justify"),
+    )
+    OPENPYXL_VERTICAL_ALIGNMENTS: Tuple[Tuple[int, str], ...] = (
+        (Qt.AlignmentFlag.AlignTop.value, "top"),
+        (Qt.AlignmentFlag.AlignBottom.value, "bottom"),
+        (Qt.AlignmentFlag.AlignVCenter.value, "center"),
+        # > Wordless: Not sure
+        (Qt.AlignmentFlag.AlignBaseline.value, "justify"),
+    )
+    # int(Qt.AlignmentFlag) -> openpyxl Alignment, shared by all exported cells
+    openpyxl_alignment_cache: Dict[int, Alignment] = {}
+
     def __init__(
         self,
         *args,
@@ -190,21 +276,25 @@ class Ng_TableView(QTableView):
         self.setHorizontalScrollMode(QAbstractItemView.ScrollMode.ScrollPerPixel)
         self.setVerticalScrollMode(QAbstractItemView.ScrollMode.ScrollPerPixel)
         self.horizontalHeader().setHighlightSections(False)
-        self.horizontalHeader().setSectionResizeMode(QHeaderView.ResizeMode.ResizeToContents)
+        # Columns are fitted to contents on data updates only, ResizeToContents
+        # would re-measure the cells on every change and repaint
+        self.horizontalHeader().setSectionResizeMode(QHeaderView.ResizeMode.Interactive)
         self.verticalHeader().setHighlightSections(False)
         self.verticalHeader().setSectionResizeMode(QHeaderView.ResizeMode.Fixed)
+        self.resizeColumnsToContents()
 
         if self.model_.is_empty():
             self.setEnabled(False)
 
     def on_data_cleared(self) -> None:
-        self.horizontalHeader().resizeSections()
+        self.resizeColumnsToContents()
         self.setEnabled(False)
 
     def on_data_updated(self) -> None:
         # TODO: only need to enable at the first time
         if not self.isEnabled():
             self.setEnabled(True)
+        self.resizeColumnsToContents()
         self.scrollToBottom()
 
     # Override to specify the return type
@@ -212,15 +302,11 @@ class Ng_TableView(QTableView):
         return self.model_
 
     def set_openpyxl_horizontal_header_alignment(self, cell) -> None:
-        from openpyxl.styles import Alignment
-
-        cell.alignment = Alignment(horizontal="center", vertical="center", wrap_text=True)
+        cell.alignment = self.OPENPYXL_HORIZONTAL_HEADER_ALIGNMENT
 
     def set_openpyxl_vertical_header_alignment(self, cell) -> None:
-        from openpyxl.styles import Alignment
-
         if self.has_vertical_header:
-            cell.alignment = Alignment(horizontal="left", vertical="center", wrap_text=True)
+            cell.alignment = self.OPENPYXL_VERTICAL_HEADER_ALIGNMENT
 
     def set_openpyxl_cell_alignment(self, cell, item: QStandardItem) -> None:
         # https://doc.qt.io/qtforpython-6/PySide6/QtCore/Qt.html#PySide6.QtCore.PySide6.QtCore.Qt.AlignmentFlag
@@ -233,36 +319,20 @@ class Ng_TableView(QTableView):
         #  Horizontal: justify, center, distributed, left, right, fill, general, centerContinuous
         #  Vertical:   justify, center, distributed, top,  bottom
 
-        from openpyxl.styles import Alignment
-
-        alignment_item: Qt.AlignmentFlag = item.textAlignment()
+        alignment_item = int(item.textAlignment())
+        if (alignment := self.openpyxl_alignment_cache.get(alignment_item)) is not None:
+            cell.alignment = alignment
+            return
 
-        # Horizontal
-        if alignment_item & Qt.AlignmentFlag.AlignLeft:
-            alignment_cell_horizontal = "left"
-        elif alignment_item & Qt.AlignmentFlag.AlignRight:
-            alignment_cell_horizontal = "right"
-        elif alignment_item & Qt.AlignmentFlag.AlignHCenter:
-            alignment_cell_horizontal = "center"
-        elif alignment_item & Qt.AlignmentFlag.AlignJustify:
-            alignment_cell_horizontal = "justify"
-        else:
-            alignment_cell_horizontal = "left"
-
-        # Vertical
-        if Qt.AlignmentFlag.AlignTop in alignment_item:
-            alignment_cell_vertical = "top"
-        elif Qt.AlignmentFlag.AlignBottom in alignment_item:
-            alignment_cell_vertical = "bottom"
-        elif Qt.AlignmentFlag.AlignVCenter in alignment_item:
-            alignment_cell_vertical = "center"
-        # > Wordless: Not sure
-        elif Qt.AlignmentFlag.AlignBaseline in alignment_item:
-            alignment_cell_vertical = "justify"
-        else:
-            alignment_cell_vertical = "center"
+        # The first matched bit wins, "left" and "center" are the fallbacks
+        alignment_cell_horizontal = next(
+            (name for bit, name in self.OPENPYXL_HORIZONTAL_ALIGNMENTS if alignment_item & bit), "left"
+        )
+        alignment_cell_vertical = next(
+            (name for bit, name in self.OPENPYXL_VERTICAL_ALIGNMENTS if alignment_item & bit), "center"
+        )
 
-        cell.alignment = Alignment(
+        cell.alignment = self.openpyxl_alignment_cache[alignment_item] = Alignment(
             horizontal=alignment_cell_horizontal, vertical=alignment_cell_vertical, wrap_text=True
         )
 
@@ -283,148 +353,150 @@ class Ng_TableView(QTableView):
         try:
             if ".xlsx" in file_type:
                 # https://github.com/BLKSerene/Wordless/blob/main/wordless/wl_widgets/wl_tables.py#L701C1-L716C54
-                import openpyxl
-                from openpyxl.styles import Font, PatternFill
-                from openpyxl.utils import get_column_letter
-
-                workbook = openpyxl.Workbook()
-                worksheet = workbook.active
-                worksheet_cell = worksheet.cell
+                # Write-only mode streams rows into the file instead of keeping
+                # a cell object for every cell in memory. Sheet dimensions and
+                # views have to be set before the first row is appended.
+                workbook = openpyxl.Workbook(write_only=True)
+                worksheet = workbook.create_sheet()
 
                 rowno_cell_offset = 2 if self.has_horizontal_header else 1
                 colno_cell_offset = 2 if self.has_vertical_header else 1
 
                 # https://github.com/BLKSerene/Wordless/blob/main/wordless/wl_widgets/wl_tables.py#L628C3-L629C82
-                dpi_horizontal = QApplication.primaryScreen().logicalDotsPerInchX()
-                dpi_vertical = QApplication.primaryScreen().logicalDotsPerInchY()
+                dpi_horizontal = self.main.dpi_horizontal
+                dpi_vertical = self.main.dpi_vertical
 
                 font_size = Ng_Settings.value("Appearance/font-size", type=int)
 
-                # 1. Horizontal header text and alignment
-                if self.has_horizontal_header:
-                    for colno_cell, colno_item in enumerate(range(col_count)):
-                        cell = worksheet_cell(1, colno_cell_offset + colno_cell)
-                        cell.value = model.horizontalHeaderItem(colno_item).text()
-                        self.set_openpyxl_horizontal_header_alignment(cell)
-                # 2. Vertical header text and alignment
-                if self.has_vertical_header:
-                    for rowno_cell, rowno_item in enumerate(range(row_count)):
-                        cell = worksheet_cell(rowno_cell_offset + rowno_cell, 1)
-                        cell.value = model.verticalHeaderItem(rowno_item).text()
-                        self.set_openpyxl_vertical_header_alignment(cell)
-
-                # 3. Both header background and font
-                # 3.0.1 Get header background
+                # 1. Header background and font
+                # 1.1 Get header background
+                #  TODO: Currently all tabpages share the same style sheet and the
+                #   single QSS file is loaded from MainWindow, thus here the
+                #   style sheet is accessed from self. In the future different
+                #   tabs might load their own QSS files, and the style sheet
+                #   should be accessed from the QTabWidget. This is also the
+                #   case for all other "self.styleSheet()" expressions, when
+                #   making this change, remember to edit all of them.
+                qss = self.main.styleSheet()
                 horizon_bacolor: Optional[str] = Ng_QSS.get_value(
-                    self.main.styleSheet(), "QHeaderView::section:horizontal", "background-color"
+                    qss, "QHeaderView::section:horizontal", "background-color"
                 )
+                if horizon_bacolor is not None:
+                    horizon_bacolor = horizon_bacolor.lstrip("#")
                 vertical_bacolor: Optional[str] = Ng_QSS.get_value(
-                    self.main.styleSheet(), "QHeaderView::section:vertical", "background-color"
+                    qss, "QHeaderView::section:vertical", "background-color"
                 )
-                # 3.0.2 Get header font, currently only consider color and boldness
+                if vertical_bacolor is not None:
+                    vertical_bacolor = vertical_bacolor.lstrip("#")
+                # 1.2 Get header font, currently only consider color and boldness
                 #  https://www.codespeedy.com/change-font-color-of-excel-cells-using-openpyxl-in-python/
                 #  https://doc.qt.io/qt-6/stylesheet-reference.html#font-weight
-                header_font_color = Ng_QSS.get_value(self.main.styleSheet(), "QHeaderView::section", "color")
+                header_font_color = Ng_QSS.get_value(qss, "QHeaderView::section", "color")
                 header_font_color = header_font_color.lstrip("#") if header_font_color is not None else "000"
-                header_font_weight = Ng_QSS.get_value(
-                    self.main.styleSheet(), "QHeaderView::section", "font-weight"
-                )
+                header_font_weight = Ng_QSS.get_value(qss, "QHeaderView::section", "font-weight")
                 header_is_bold = (header_font_weight == "bold") if header_font_weight is not None else False
-                # 3.1 Horizontal header background and font
-                if self.has_horizontal_header:
-                    # 3.1.1 Horizontal header background
-                    #  TODO: Currently all tabpages share the same style sheet and the
-                    #   single QSS file is loaded from MainWindow, thus here the
-                    #   style sheet is accessed from self. In the future different
-                    #   tabs might load their own QSS files, and the style sheet
-                    #   should be accessed from the QTabWidget. This is also the
-                    #   case for all other "self.styleSheet()" expressions, when
-                    #   making this change, remember to edit all of them.
-                    if horizon_bacolor is not None:
-                        horizon_bacolor = horizon_bacolor.lstrip("#")
-                        for colno in range(col_count):
-                            cell = worksheet_cell(1, colno_cell_offset + colno)
-                            cell.fill = PatternFill(fill_type="solid", fgColor=horizon_bacolor)
-                    # 3.1.2 Horizontal header font
-                    for colno in range(col_count):
-                        cell = worksheet_cell(1, colno_cell_offset + colno)
-                        cell.font = Font(
-                            color=header_font_color,
-                            bold=header_is_bold,
-                            size=font_size,
-                        )
-                # 3.2 Vertical header background and font
-                if self.has_vertical_header:
-                    # 3.2.1 Vertial header background
-                    if vertical_bacolor is not None:
-                        vertical_bacolor = vertical_bacolor.lstrip("#")
-                        for rowno in range(row_count):
-                            cell = worksheet_cell(rowno_cell_offset + rowno, 1)
-                            cell.fill = PatternFill(fill_type="solid", fgColor=vertical_bacolor)
-                    # 3.2.2 Vertical header font
-                    for rowno in range(row_count):
-                        cell = worksheet_cell(rowno_cell_offset + rowno, 1)
-                        cell.font = Font(
-                            color=header_font_color,
-                            bold=header_is_bold,
-                            size=font_size,
-                        )
-
-                # 4. Cells
-                for rowno in range(row_count):
-                    for colno in range(col_count):
-                        cell = worksheet_cell(rowno_cell_offset + rowno, colno_cell_offset + colno)
-                        item = model.item(rowno, colno)
-                        item_value = item.text()
-                        try:  # noqa: SIM105
-                            item_value = float(item_value)
-                        except ValueError:
-                            pass
-                        cell.value = item_value
-                        self.set_openpyxl_cell_alignment(cell, item)
-                        cell.font = Font(size=font_size)
-                # 5. Column width
+
+                # 2. Column width
                 for colno in range(col_count):
                     # https://github.com/BLKSerene/Wordless/blob/main/wordless/wl_widgets/wl_tables.py#L729
                     worksheet.column_dimensions[get_column_letter(colno_cell_offset + colno)].width = (
                         self.horizontalHeader().sectionSize(colno) / dpi_horizontal * 13 + 3
                     )
-
                 if self.has_vertical_header:
                     # https://github.com/BLKSerene/Wordless/blob/main/wordless/wl_widgets/wl_tables.py#L731
                     worksheet.column_dimensions[get_column_letter(1)].width = (
                         self.verticalHeader().width() / dpi_horizontal * 13 + 3
                     )
-                # 6. Row height
+                # 3. Row height
                 worksheet.row_dimensions[1].height = self.horizontalHeader().height() / dpi_vertical * 72
-                for i, _ in enumerate(worksheet.rows):
-                    worksheet.row_dimensions[2 + i].height = (
+                for rowno_cell in range(2, rowno_cell_offset + row_count):
+                    worksheet.row_dimensions[rowno_cell].height = (
                         self.verticalHeader().sectionSize(0) / dpi_vertical * 72
                     )
 
-                # 7. Freeze panes
+                # 4. Freeze panes
                 # https://stackoverflow.com/questions/73837417/freeze-panes-first-two-rows-and-column-with-openpyxl
                 # Using "2" in both cases means to always freeze the 1st column
                 if self.has_horizontal_header:
                     worksheet.freeze_panes = "B2"
                 else:
                     worksheet.freeze_panes = "A2"
+
+                # Style objects are shared by all cells of the same kind
+                header_font = Font(color=header_font_color, bold=header_is_bold, size=font_size)
+                cell_font = Font(size=font_size)
+
+                # 5. Horizontal header
+                if self.has_horizontal_header:
+                    horizon_fill = (
+                        PatternFill(fill_type="solid", fgColor=horizon_bacolor)
+                        if horizon_bacolor is not None
+                        else None
+                    )
+                    row: List[Any] = [None] * (colno_cell_offset - 1)
+                    for colno in range(col_count):
+                        cell = WriteOnlyCell(worksheet, value=model.horizontalHeaderItem(colno).text())
+                        self.set_openpyxl_horizontal_header_alignment(cell)
+                        if horizon_fill is not None:
+                            cell.fill = horizon_fill
+                        cell.font = header_font
+                        row.append(cell)
+                    worksheet.append(row)
+
+                # 6. Vertical header and cells
+                vertical_fill = (
+                    PatternFill(fill_type="solid", fgColor=vertical_bacolor)
+                    if vertical_bacolor is not None
+                    else None
+                )
+                model_item = model.item
+                ver_header_item = model.verticalHeaderItem
+                set_cell_alignment = self.set_openpyxl_cell_alignment
+                is_numeric_role = model.IsNumericRole
+                append_row = worksheet.append
+                colnos = range(col_count)
+                for rowno in range(row_count):
+                    row = []
+                    if self.has_vertical_header:
+                        cell = WriteOnlyCell(worksheet, value=ver_header_item(rowno).text())
+                        self.set_openpyxl_vertical_header_alignment(cell)
+                        if vertical_fill is not None:
+                            cell.fill = vertical_fill
+                        cell.font = header_font
+                        row.append(cell)
+                    for colno in colnos:
+                        item = model_item(rowno, colno)
+                        item_value = item.text()
+                        # Items known to be strings skip the float() attempt
+                        if item.data(is_numeric_role) is not False:
+                            try:  # noqa: SIM105
+                                item_value = float(item_value)
+                            except ValueError:
+                                pass
+                        cell = WriteOnlyCell(worksheet, value=item_value)
+                        set_cell_alignment(cell, item)
+                        cell.font = cell_font
+                        row.append(cell)
+                    append_row(row)
+
                 workbook.save(file_path)
             elif ".csv" in file_type or ".tsv" in file_type:
-                import csv
-
                 dialect = csv.excel if ".csv" in file_type else csv.excel_tab
                 with open(os_path.normpath(file_path), "w", newline="", encoding="utf-8") as fh:
                     csv_writer = csv.writer(fh, dialect=dialect, lineterminator="\n")
+                    item = model.item
+                    ver_header_item = model.verticalHeaderItem
+                    hor_header_item = model.horizontalHeaderItem
+                    colnos = range(col_count)
                     # Horizontal header
-                    hor_header: List[str] = [""]
-                    hor_header.extend(model.horizontalHeaderItem(colno).text() for colno in range(col_count))
-                    csv_writer.writerow(hor_header)
+                    csv_writer.writerow(["", *(hor_header_item(colno).text() for colno in colnos)])
                     # Vertical header + cells
-                    for rowno in range(row_count):
-                        row: List[str] = [model.verticalHeaderItem(rowno).text()]
-                        row.extend(model.item(rowno, colno).text() for colno in range(col_count))
-                        csv_writer.writerow(row)
+                    csv_writer.writerows(
+                        [
+                            [ver_header_item(rowno).text(), *(item(rowno, colno).text() for colno in colnos)]
+                            for rowno in range(row_count)
+                        ]
+                    )
             QMessageBox.information(
                 self, "Success", f"The table has been successfully exported to {file_path}."
             )
@@ -451,17 +523,13 @@ class Ng_TableView(QTableView):
         row_count = model.rowCount()
         try:
             if ".xlsx" in file_type:
-                import openpyxl
-                from openpyxl.styles import Alignment, Font
-                from openpyxl.utils import get_column_letter
-
                 workbook = openpyxl.Workbook()
                 for sheetname in workbook.sheetnames:
                     workbook.remove(workbook.get_sheet_by_name(sheetname))
 
                 # https://github.com/BLKSerene/Wordless/blob/main/wordless/wl_widgets/wl_tables.py#L628C3-L629C82
-                dpi_horizontal = QApplication.primaryScreen().logicalDotsPerInchX()
-                dpi_vertical = QApplication.primaryScreen().logicalDotsPerInchY()
+                dpi_horizontal = self.main.dpi_horizontal
+                dpi_vertical = self.main.dpi_vertical
 
                 font_size = Ng_Settings.value("Appearance/font-size", type=int)
 
@@ -547,8 +615,6 @@ class Ng_TableView(QTableView):
 
                 workbook.save(file_path)
             elif ".csv" in file_type or ".tsv" in file_type:
-                import csv
-
                 dialect = csv.excel if ".csv" in file_type else csv.excel_tab
                 with open(os_path.normpath(file_path), "w", newline="", encoding="utf-8") as fh:
                     csv_writer = csv.writer(fh, dialect=dialect, lineterminator="\n")
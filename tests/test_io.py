@@ -0,0 +1,186 @@
+#!/usr/bin/env python3
+
+import codecs
+import lzma
+import os
+import os.path as os_path
+import pickle
+import tempfile
+import zipfile
+from unittest.mock import patch
+
+from neosca_gui.ng_io import SCAIO
+
+from tests.base_tmpl import BaseTmpl
+
+DOCX_DOCUMENT = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+    '<w:document xmlns:w="http://schemas.openxmlformats.org/wordprocessingml/2006/main"><w:body>'
+    "<w:p><w:r><w:t>There was no possibility </w:t></w:r><w:r><w:t>of taking a walk that day.</w:t></w:r></w:p>"
+    "<w:p><w:r><w:t>We had been wandering.</w:t></w:r></w:p>"
+    "<w:p></w:p>"
+    "</w:body></w:document>"
+)
+ODT_CONTENT = (
+    '<?xml version="1.0" encoding="UTF-8"?>'
+    '<office:document-content xmlns:office="urn:oasis:names:tc:opendocument:xmlns:office:1.0"'
+    ' xmlns:text="urn:oasis:names:tc:opendocument:xmlns:text:1.0"><office:body><office:text>'
+    "<text:p>There was no possibility <text:span>of taking</text:span> a walk that day.</text:p>"
+    "<text:p>We had been wandering.</text:p>"
+    "</office:text></office:body></office:document-content>"
+)
+
+
+class TestIO(BaseTmpl):
+    def setUp(self):
+        super().setUp()
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.scaio = SCAIO()
+
+    def tearDown(self):
+        self.tmpdir.cleanup()
+        super().tearDown()
+
+    def make_zip(self, filename: str, member: str, content: str) -> str:
+        path = os_path.join(self.tmpdir.name, filename)
+        with zipfile.ZipFile(path, "w", compression=zipfile.ZIP_DEFLATED) as zip_file:
+            zip_file.writestr(member, content)
+        return path
+
+    def test_read_docx(self):
+        path = self.make_zip("sample.docx", "word/document.xml", DOCX_DOCUMENT)
+        self.assertEqual(
+            self.scaio.read_docx(path),
+            "There was no possibility of taking a walk that day.\nWe had been wandering.\n",
+        )
+
+    def test_read_odt(self):
+        path = self.make_zip("sample.odt", "content.xml", ODT_CONTENT)
+        self.assertEqual(
+            self.scaio.read_odt(path),
+            "There was no possibility of taking a walk that day.\nWe had been wandering.",
+        )
+
+    def test_read_docx_nested_paragraphs(self):
+        # Paragraphs in text boxes are nested in the paragraph that anchors the text box
+        document = DOCX_DOCUMENT.replace(
+            "<w:p><w:r><w:t>We had been wandering.</w:t></w:r></w:p>",
+            "<w:p><w:r><w:t>We had been </w:t><w:pict><w:txbxContent>"
+            "<w:p><w:r><w:t>wandering.</w:t></w:r></w:p>"
+            "</w:txbxContent></w:pict></w:r></w:p>",
+        )
+        path = self.make_zip("nested.docx", "word/document.xml", document)
+        self.assertEqual(
+            self.scaio.read_docx(path),
+            "There was no possibility of taking a walk that day.\nWe had been wandering.\nwandering.\n",
+        )
+
+    def make_txt(self, filename: str, content: bytes) -> str:
+        path = os_path.join(self.tmpdir.name, filename)
+        with open(path, "wb") as f:
+            f.write(content)
+        return path
+
+    def test_read_txt(self):
+        text = "There was no possibility of taking a walk that day.\n散步是不可能了。"
+        # BOM
+        for encoding, bom in (
+            ("utf-8", codecs.BOM_UTF8),
+            ("utf-16-le", codecs.BOM_UTF16_LE),
+            ("utf-16-be", codecs.BOM_UTF16_BE),
+            ("utf-32-le", codecs.BOM_UTF32_LE),
+        ):
+            path = self.make_txt(f"{encoding}.txt", bom + text.encode(encoding))
+            self.assertEqual(self.scaio.read_txt(path), text)
+        # UTF-8 without BOM, with Windows newlines
+        path = self.make_txt("utf-8.txt", text.replace("\n", "\r\n").encode("utf-8"))
+        self.assertEqual(self.scaio.read_txt(path), text)
+        # Fall back to charset detection
+        text = "那天，出去散步是不可能了。其实，早上我们还在光秃秃的灌木林中溜达了一个小时。" * 5
+        path = self.make_txt("gb18030.txt", text.encode("gb18030"))
+        self.assertEqual(self.scaio.read_txt(path), text)
+        # Only the head of large files is used for charset detection
+        text = "\n".join([text] * 1000)
+        path = self.make_txt("gb18030-large.txt", text.encode("gb18030"))
+        self.assertEqual(self.scaio.read_txt(path), text)
+
+    def test_get_verified_ifile_list(self):
+        for filename in ("a.txt", "b.docx", "c.odt", "d.pdf", ".e.txt"):
+            self.make_txt(filename, b"There was no possibility of taking a walk that day.")
+        os.mkdir(os_path.join(self.tmpdir.name, "f.txt"))
+        self.assertEqual(
+            self.scaio.get_verified_ifile_list([self.tmpdir.name]),
+            {os_path.join(self.tmpdir.name, filename) for filename in ("a.txt", "b.docx", "c.odt")},
+        )
+        path = os_path.join(self.tmpdir.name, "a.txt")
+        self.assertEqual(self.scaio.get_verified_ifile_list([path, path]), {path})
+        self.assertEqual(
+            self.scaio.get_verified_ifile_list([os_path.join(self.tmpdir.name, "*.odt")]),
+            {os_path.join(self.tmpdir.name, "c.odt")},
+        )
+
+    def test_get_verified_ifile_list_skips_lock_files(self):
+        for filename in ("a.docx", "~$a.docx"):
+            self.make_txt(filename, b"PK")
+        expected = {os_path.join(self.tmpdir.name, "a.docx")}
+        with patch("neosca_gui.ng_io.IS_WINDOWS", True):
+            self.assertEqual(self.scaio.get_verified_ifile_list([self.tmpdir.name]), expected)
+            self.assertEqual(
+                self.scaio.get_verified_ifile_list([os_path.join(self.tmpdir.name, "*.docx")]), expected
+            )
+
+    def test_load_pickle_lzma_file(self):
+        data = {"word_dict": {"walk": 1}}
+        path = self.make_txt("data.pickle.lzma", lzma.compress(pickle.dumps(data)))
+        self.assertEqual(SCAIO.load_pickle_lzma_file(path), data)
+        self.assertEqual(SCAIO.load_lzma_file(path), pickle.dumps(data))
+        # Missing or empty files
+        self.assertIsNone(SCAIO.load_pickle_lzma_file(os_path.join(self.tmpdir.name, "missing.pickle.lzma")))
+        path = self.make_txt("empty.pickle.lzma", b"")
+        self.assertEqual(SCAIO.load_lzma_file(path, default=b""), b"")
+
+    def test_load_pickle_file(self):
+        data = {"word_dict": {"walk": 1}}
+        path = self.make_txt("data.pickle", pickle.dumps(data, protocol=pickle.HIGHEST_PROTOCOL))
+        self.assertEqual(SCAIO.load_pickle_file(path), data)
+        self.assertEqual(SCAIO.load_pickle_file(os_path.join(self.tmpdir.name, "missing.pickle"), {}), {})
+
+    def test_has_valid_cache(self):
+        file_path = self.make_txt("a.txt", b"There was no possibility of taking a walk that day.")
+        cache_path = os_path.join(self.tmpdir.name, "a.pickle.lzma")
+        self.assertFalse(SCAIO.has_valid_cache(file_path, cache_path))
+        self.make_txt("a.pickle.lzma", b"")
+        os.utime(cache_path, ns=(os.stat(file_path).st_mtime_ns + 1,) * 2)
+        self.assertFalse(SCAIO.has_valid_cache(file_path, cache_path))
+        self.make_txt("a.pickle.lzma", b"cache")
+        os.utime(cache_path, ns=(os.stat(file_path).st_mtime_ns + 1,) * 2)
+        self.assertTrue(SCAIO.has_valid_cache(file_path, cache_path))
+        os.utime(cache_path, ns=(os.stat(file_path).st_mtime_ns - 1,) * 2)
+        self.assertFalse(SCAIO.has_valid_cache(file_path, cache_path))
+
+    def test_read_files(self):
+        paths = [
+            self.make_txt("a.txt", b"There was no possibility of taking a walk that day."),
+            self.make_zip("b.docx", "word/document.xml", DOCX_DOCUMENT),
+            self.make_zip("c.odt", "content.xml", ODT_CONTENT),
+            self.make_txt("d.pdf", b"%PDF"),
+        ]
+        self.assertEqual(
+            self.scaio.read_files(paths, max_workers=2), {path: self.scaio.read_file(path) for path in paths}
+        )
+
+    def test_get_file_sizes(self):
+        paths = [self.make_txt("a.txt", b"There was no possibility"), self.make_txt("b.txt", b"")]
+        self.assertEqual(SCAIO.get_file_sizes(paths + paths[:1], max_workers=2), {paths[0]: 24, paths[1]: 0})
+        self.assertEqual(SCAIO.get_file_sizes(paths[1:]), {paths[1]: 0})
+        self.assertEqual(SCAIO.get_file_sizes([]), {})
+
+    def test_read_file_cache(self):
+        path = self.make_txt("a.txt", b"There was no possibility of taking a walk that day.")
+        self.assertEqual(self.scaio.read_file(path), "There was no possibility of taking a walk that day.")
+        with patch.object(self.scaio, "extension_readfunc_map", {}):
+            # Served from cache without calling any reader
+            self.assertEqual(self.scaio.read_file(path), "There was no possibility of taking a walk that day.")
+        # Modified files are read again
+        self.make_txt("a.txt", b"We had been wandering.")
+        self.assertEqual(self.scaio.read_file(path), "We had been wandering.")
@@ -86,3 +86,19 @@ class TestQSS(BaseTmpl):
         qss_str = "QHeaderView::section:horizontal { background-color: #5C88C5; }"
         value = Ng_QSS.get_value(qss_str, "QHeaderView::section:horizontal", "background-color")
         self.assertEqual(value, "#5C88C5")
+        # Only declarations after the selector are considered
+        qss_str = "QTableView { color: black; } QHeaderView::section { font-weight: bold; }"
+        self.assertEqual(Ng_QSS.get_value(qss_str, "QHeaderView::section", "font-weight"), "bold")
+        self.assertIsNone(Ng_QSS.get_value(qss_str, "QHeaderView::section", "color"))
+        self.assertIsNone(Ng_QSS.get_value(qss_str, "QPushButton", "color"))
+        # Selectors and property names are matched as a whole
+        qss_str = (
+            "QHeaderView::section:horizontal { background-color: #5C88C5; }"
+            " QHeaderView::section { color: #FFFFFF; font-weight: bold; }"
+        )
+        self.assertEqual(Ng_QSS.get_value(qss_str, "QHeaderView::section", "color"), "#FFFFFF")
+        self.assertIsNone(Ng_QSS.get_value(qss_str, "QHeaderView::section:horizontal", "color"))
+        self.assertIsNone(Ng_QSS.get_value(qss_str, "QHeaderView", "color"))
+        self.assertEqual(Ng_QSS.get_value("QPushButton{color: black;}", "QPushButton", "color"), "black")
+        # Selectors are not regular expressions
+        self.assertEqual(Ng_QSS.get_value("* { font-size: 11pt; }", "*", "font-size"), "11pt")
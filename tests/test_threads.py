@@ -0,0 +1,82 @@
+#!/usr/bin/env python3
+
+import tempfile
+from pathlib import Path
+from types import SimpleNamespace
+from unittest.mock import MagicMock, patch
+
+import neosca_gui
+
+# Importing the GUI modules writes default settings, keep them out of the source tree
+neosca_gui.SETTING_PATH = Path(tempfile.mkdtemp()) / "settings.ini"
+
+from neosca_gui.ng_lca.lca import LCA  # noqa: E402
+from neosca_gui.ng_main import LCA_HEADER_LABELS, SCA_HEADER_LABELS, Ng_Main  # noqa: E402
+from neosca_gui.ng_sca.structure_counter import StructureCounter  # noqa: E402
+from neosca_gui.ng_threads import Ng_Worker_LCA_Generate_Table, Ng_Worker_SCA_Generate_Table  # noqa: E402
+from neosca_gui.ng_widgets.ng_tables import Ng_StandardItemModel  # noqa: E402
+
+from tests.base_tmpl import BaseTmpl  # noqa: E402
+
+
+class TestThreads(BaseTmpl):
+    def make_main(self, file_names, **kwargs) -> SimpleNamespace:
+        return SimpleNamespace(
+            yield_added_file_names_and_paths=lambda: ((name, f"{name}.txt") for name in file_names),
+            **kwargs,
+        )
+
+    def vertical_header_texts(self, model: Ng_StandardItemModel):
+        return [model.verticalHeaderItem(rowno).text() for rowno in range(model.rowCount())]
+
+    def run_sca(self, main: SimpleNamespace, skipped=()) -> None:
+        main.sca_instance = MagicMock()
+        main.sca_instance.parse_and_query_ifile.side_effect = lambda path: (
+            None if path[:-4] in skipped else StructureCounter()
+        )
+        worker = Ng_Worker_SCA_Generate_Table(main=main)
+        worker.counter_ready.connect(lambda *args: Ng_Main.sca_add_data(main, *args))
+        with patch("neosca_gui.ng_threads.QMessageBox"):
+            worker.run()
+
+    def test_sca_rerun_with_fewer_rows(self):
+        model = Ng_StandardItemModel(main=None)
+        model.setHorizontalHeaderLabels(SCA_HEADER_LABELS)
+        main = self.make_main(("a", "b", "c"), model_sca=model, checkbox_cache_sca=MagicMock())
+        self.run_sca(main)
+        self.assertEqual(self.vertical_header_texts(model), ["a", "b", "c"])
+        # Rows of the previous run do not outlive a shorter rerun
+        main.yield_added_file_names_and_paths = self.make_main(("a", "z")).yield_added_file_names_and_paths
+        self.run_sca(main)
+        self.assertEqual(self.vertical_header_texts(model), ["a", "z"])
+        main.yield_added_file_names_and_paths = self.make_main(("a", "y", "z")).yield_added_file_names_and_paths
+        self.run_sca(main, skipped=("a",))
+        self.assertEqual(self.vertical_header_texts(model), ["y", "z"])
+
+    def run_lca(self, main: SimpleNamespace, skipped=()) -> None:
+        main.lca_instance = MagicMock()
+        main.lca_instance._analyze.side_effect = lambda file_path: (
+            None if file_path[:-4] in skipped else [file_path, *range(len(LCA.FIELDNAMES) - 1)]
+        )
+        with patch("neosca_gui.ng_threads.QMessageBox"):
+            Ng_Worker_LCA_Generate_Table(main=main).run()
+
+    def test_lca_rerun_with_every_file_skipped(self):
+        model = Ng_StandardItemModel(main=None)
+        model.setHorizontalHeaderLabels(LCA_HEADER_LABELS)
+        main = self.make_main(
+            ("a", "b", "c"),
+            model_lca=model,
+            radiobutton_wordlist_BNC=MagicMock(),
+            radiobutton_tagset_ud=MagicMock(),
+            checkbox_cache_lca=MagicMock(),
+        )
+        self.run_lca(main)
+        self.assertEqual(self.vertical_header_texts(model), ["a", "b", "c"])
+        # The previous table is left untouched rather than cut down
+        main.yield_added_file_names_and_paths = self.make_main(("x",)).yield_added_file_names_and_paths
+        self.run_lca(main, skipped=("x",))
+        self.assertEqual(self.vertical_header_texts(model), ["a", "b", "c"])
+        main.yield_added_file_names_and_paths = self.make_main(("a", "x")).yield_added_file_names_and_paths
+        self.run_lca(main, skipped=("x",))
+        self.assertEqual(self.vertical_header_texts(model), ["a"])